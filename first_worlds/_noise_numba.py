@@ -0,0 +1,31 @@
+"""_noise_numba.py
+
+Numba kernel for value-noise octaves, used by textures.make_value_noise.
+
+Kept in its own module so that importing textures doesn't import Numba; the
+textures module loads this lazily the first time noise is generated.
+"""
+from __future__ import annotations
+
+import math
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def accumulate_octave(out, grid, step, size, amplitude):
+    """Add one bilinearly interpolated octave of `grid` into `out`."""
+    denom = max(1, size - 1)
+    for yi in prange(size):
+        y = yi * step / denom
+        y0 = int(math.floor(y))
+        y1 = min(step, y0 + 1)
+        ty = y - y0
+        for xi in range(size):
+            x = xi * step / denom
+            x0 = int(math.floor(x))
+            x1 = min(step, x0 + 1)
+            tx = x - x0
+            a = grid[y0, x0] * (1.0 - tx) + grid[y0, x1] * tx
+            b = grid[y1, x0] * (1.0 - tx) + grid[y1, x1] * tx
+            out[yi, xi] += amplitude * (a * (1.0 - ty) + b * ty)
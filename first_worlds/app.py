@@ -11,18 +11,25 @@ apply to object, export/import recipe.
 """
 from __future__ import annotations
 
+import functools
 import os
+import queue
+import sys
+import threading
 from typing import Optional
 
 from .engine import Engine, EngineConfig
-from .textures import generate_pbr_like
+from .textures import generate_pbr_like, resolve_style
 from .materials import MaterialParams, apply_material, pil_to_panda_texture, combine_metal_roughness_to_texture
 from .commands import infer_style_from_prompt
 from .recipe import SceneRecipe, ObjectRecipe
 
 
+@functools.lru_cache(maxsize=16)
 def _build_material_from_style(style: str, size: int = 256) -> MaterialParams:
-	maps = generate_pbr_like(size=size, style=style)
+	# A fixed seed makes maps deterministic per (style, size), so the uploaded
+	# textures can be reused whenever a style is applied again.
+	maps = generate_pbr_like(size=size, style=style, seed=0)
 	base = pil_to_panda_texture(maps.albedo)
 	mr = combine_metal_roughness_to_texture(maps.roughness, maps.metalness)
 	return MaterialParams(
@@ -31,29 +38,57 @@ def _build_material_from_style(style: str, size: int = 256) -> MaterialParams:
 	)
 
 
+def _vec3(v) -> tuple[float, float, float]:
+	"""Copy a Panda3D vector's components without going through its iterator."""
+	return (v[0], v[1], v[2])
+
+
+def _read_stdin(lines: queue.Queue) -> None:
+	"""Forward terminal lines to the frame task until stdin is closed."""
+	while True:
+		line = sys.stdin.readline()
+		if not line:
+			break
+		lines.put(line)
+
+
 def run() -> None:
+	# Build the default material while the window opens; the result lands in
+	# the material cache, so the lookup below is just a cache hit.
+	warmup = threading.Thread(target=_build_material_from_style, args=("checker",), daemon=True)
+	warmup.start()
+
 	app = Engine(EngineConfig())
 	cube = app.add_unit_cube("cube")
 	cube.set_pos(0, 0, 0)
 	cube.set_scale(1.5)
 
 	# Apply default material
+	warmup.join()
 	params = _build_material_from_style("checker")
 	apply_material(cube, params)
+	current_style = "checker"
 
 	def apply_style(style: str) -> None:
+		nonlocal current_style
+		# Resolve before the cache lookup so typos don't fill the cache with
+		# extra checker materials or end up in exported recipes.
+		style = resolve_style(style)
+		if style == current_style:
+			return
 		material = _build_material_from_style(style)
 		apply_material(cube, material)
+		current_style = style
 
 	def export_recipe(path: str) -> None:
 		recipe = SceneRecipe(objects=[
 			ObjectRecipe(
 				name="cube",
 				model_path=None,
-				position=tuple(cube.get_pos()),
-				hpr=tuple(cube.get_hpr()),
-				scale=tuple(cube.get_scale()),
-				material_style="checker",  # For simplicity, we track last style loosely
+				position=_vec3(cube.get_pos()),
+				hpr=_vec3(cube.get_hpr()),
+				scale=_vec3(cube.get_scale()),
+				material_style=current_style,
 			)
 		])
 		recipe.save(path)
@@ -64,10 +99,10 @@ def run() -> None:
 			print(f"No recipe found at {path}")
 			return
 		recipe = SceneRecipe.load(path)
-		if not recipe.objects:
+		if len(recipe) == 0:
 			print("Recipe has no objects")
 			return
-		obj = recipe.objects[0]
+		obj = recipe[0]
 		cube.set_pos(*obj.position)
 		cube.set_hpr(*obj.hpr)
 		cube.set_scale(*obj.scale)
@@ -81,19 +116,15 @@ def run() -> None:
 	print("  prompt <free text>              -> infer style from text")
 	print("  quit                            -> exit app\n")
 
+	# Block on stdin in a daemon thread; the frame task only polls the queue.
+	lines: queue.Queue = queue.Queue()
+	threading.Thread(target=_read_stdin, args=(lines,), daemon=True).start()
+
 	def cli_task(task):
 		try:
-			if os.name == "posix":
-				import select, sys
-				dr, _, _ = select.select([sys.stdin], [], [], 0.0)
-				if dr:
-					line = sys.stdin.readline().strip()
-				else:
-					line = None
-			else:
-				line = None
-		except Exception:
-			line = None
+			line = lines.get_nowait().strip()
+		except queue.Empty:
+			return task.cont
 
 		if line:
 			parts = line.split(" ", 1)
@@ -101,7 +132,7 @@ def run() -> None:
 			arg = parts[1] if len(parts) > 1 else ""
 			if cmd == "style":
 				apply_style(arg.strip() or "checker")
-				print(f"Applied style: {arg}")
+				print(f"Applied style: {current_style}")
 			elif cmd == "export":
 				export_recipe(arg.strip() or "scene.recipe.json")
 			elif cmd == "import":
@@ -11,6 +11,7 @@ We don't do NLP here; we perform keyword matching to choose a style.
 """
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -21,12 +22,20 @@ STYLE_KEYWORDS = {
     "metal": ["metal", "steel", "chrome"],
 }
 
+_TOKEN_TO_STYLE = {k: s for s, ks in STYLE_KEYWORDS.items() for k in ks}
+# One pass over the prompt; longer keywords first so "cobblestone" wins over
+# "cobble". No trailing \b, so plurals like "rocks" still match.
+_PATTERN = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(_TOKEN_TO_STYLE, key=len, reverse=True))) + r")",
+    re.IGNORECASE,
+)
+
 
 def infer_style_from_prompt(prompt: str, default: str = "checker") -> str:
+    m = _PATTERN.search(prompt)
+    if m:
+        return _TOKEN_TO_STYLE[m.group(1).lower()]
     text = prompt.lower()
-    for style, keywords in STYLE_KEYWORDS.items():
-        if any(k in text for k in keywords):
-            return style
     # fallback by simple adjectives
     if "wet" in text and ("stone" in text or "cobble" in text):
         return "stone"
@@ -22,7 +22,7 @@ except Exception:
     HAVE_GLTF = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineConfig:
     window_title: str = "FirstWorlds (Python)"
     background_color: tuple[float, float, float, float] = (0.05, 0.05, 0.07, 1.0)
@@ -3,23 +3,25 @@
 A minimal undo/redo stack. Stores callables to apply and revert actions.
 
 This is deliberately simple: each action has two functions: do() and undo().
+Both stacks are bounded; once full, the oldest action is dropped.
 """
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     do: Callable[[], None]
     undo: Callable[[], None]
 
 
 class History:
-    def __init__(self) -> None:
-        self._done: List[Action] = []
-        self._undone: List[Action] = []
+    def __init__(self, max_history: int = 256) -> None:
+        self._done: deque[Action] = deque(maxlen=max_history)
+        self._undone: deque[Action] = deque(maxlen=max_history)
 
     def apply(self, action: Action) -> None:
         action.do()
@@ -11,7 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from panda3d.core import Texture, PNMImage, SamplerState
+from panda3d.core import ATS_none, CPTA_uchar, Texture, SamplerState
 
 try:  # Optional Pillow dependency for combining maps
 	from PIL import Image
@@ -20,7 +20,7 @@ except Exception:
 	HAVE_PIL = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialParams:
 	base_color_tex: Optional[Texture] = None
 	# simplepbr expects a single MetalRoughness texture where
@@ -29,40 +29,46 @@ class MaterialParams:
 
 
 def pil_to_panda_texture(pil_image) -> Texture:
-	"""Convert a Pillow image to a Panda3D Texture (RGBA)."""
-	rgba = pil_image.convert("RGBA")
-	width, height = rgba.size
-	pnm = PNMImage(width, height, 4)
-	data = rgba.tobytes()
-	idx = 0
-	for y in range(height):
-		for x in range(width):
-			r = data[idx] / 255.0
-			g = data[idx + 1] / 255.0
-			b = data[idx + 2] / 255.0
-			a = data[idx + 3] / 255.0
-			pnm.setXelA(x, height - 1 - y, r, g, b, a)
-			idx += 4
+	"""Convert a Pillow image to a Panda3D Texture (RGB or RGBA).
+
+	RGB images stay 3-channel; everything else is converted to RGBA. Panda3D
+	expects rows bottom-up, so the image is flipped first. The full mipmap chain
+	is box-filtered here, so the render thread doesn't have to generate it.
+	"""
+	if pil_image.mode == "RGB":
+		fmt, raw_mode = Texture.F_rgb, "BGR"
+	else:
+		pil_image = pil_image.convert("RGBA")
+		fmt, raw_mode = Texture.F_rgba, "BGRA"
+	img = pil_image.transpose(Image.FLIP_TOP_BOTTOM)
+	width, height = img.size
 	tex = Texture()
-	tex.load(pnm)
+	tex.setup_2d_texture(width, height, Texture.T_unsigned_byte, fmt)
+	tex.set_auto_texture_scale(ATS_none)
+	# Panda3D stores texels in BGR(A) order; set_ram_mipmap_image() only takes
+	# a CPTA_uchar, so every level is wrapped the same way.
+	tex.set_ram_image(CPTA_uchar(img.tobytes("raw", raw_mode)))
+	for level in range(1, tex.get_expected_num_mipmap_levels()):
+		img = img.resize((tex.get_expected_mipmap_x_size(level), tex.get_expected_mipmap_y_size(level)), Image.BOX)
+		tex.set_ram_mipmap_image(level, CPTA_uchar(img.tobytes("raw", raw_mode)))
 	tex.set_magfilter(SamplerState.FT_linear)
 	tex.set_minfilter(SamplerState.FT_linear_mipmap_linear)
 	return tex
 
 
 def combine_metal_roughness_to_texture(roughness_img, metalness_img, size: int | None = None) -> Optional[Texture]:
-	"""Pack roughness (G) and metalness (B) into one RGBA image for simplepbr.
+	"""Pack roughness (G) and metalness (B) into one RGB image for simplepbr.
 
 	Returns a Panda3D Texture, or None if Pillow is unavailable.
 	"""
 	if not HAVE_PIL:
 		return None
-	# Ensure both are single-channel L images and same size
+	# Ensure both are single-channel L images and same size; R is unused and
+	# there is no alpha, so the packed map needs only three channels.
 	r = Image.new("L", roughness_img.size, 255)
 	g = roughness_img.convert("L")
 	b = metalness_img.convert("L")
-	a = Image.new("L", roughness_img.size, 255)
-	combo = Image.merge("RGBA", (r, g, b, a))
+	combo = Image.merge("RGB", (r, g, b))
 	return pil_to_panda_texture(combo)
 
 
@@ -72,7 +78,14 @@ def apply_material(nodepath, params: MaterialParams) -> None:
 	Expected inputs:
 	- p3d_TextureBaseColor: base/albedo map (RGBA/RGB)
 	- p3d_TextureMetalRoughness: packed map where G=roughness, B=metallic
+
+	Re-applying the textures that are already attached is a no-op.
 	"""
+	applied = (params.base_color_tex, params.metal_roughness_tex)
+	previous = nodepath.get_python_tag("_fw_mat")
+	if previous is not None and all(a is b for a, b in zip(previous, applied)):
+		return
+	nodepath.set_python_tag("_fw_mat", applied)
 	if params.base_color_tex is not None:
 		nodepath.set_shader_input("p3d_TextureBaseColor", params.base_color_tex)
 	if params.metal_roughness_tex is not None:
@@ -4,15 +4,26 @@ A simple, reproducible scene recipe format (JSON).
 
 We store a list of objects and their material styles. This is intentionally
 minimal for clarity and educational purposes.
+
+Internally a scene keeps one column per field: names/styles as lists and the
+transforms as (N, 3) float64 arrays, so bulk edits are single NumPy ops.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
 import json
 
+import numpy as np
+
+try:  # Optional orjson dependency for faster (de)serialization
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
 
-@dataclass
+
+@dataclass(slots=True)
 class ObjectRecipe:
     name: str
     model_path: str | None
@@ -22,33 +33,138 @@ class ObjectRecipe:
     material_style: str
 
 
-@dataclass
+def _vec3_array(values) -> np.ndarray:
+    # float64 so values like 0.1 round-trip exactly through JSON.
+    arr = np.asarray(values, dtype=np.float64)
+    return arr.reshape(0, 3) if arr.size == 0 else arr
+
+
 class SceneRecipe:
-    objects: List[ObjectRecipe]
+    __slots__ = ("names", "model_paths", "material_styles", "positions", "hpr", "scales")
+
+    def __init__(self, objects: Iterable[ObjectRecipe] = ()) -> None:
+        objects = list(objects)
+        self.names: List[str] = [o.name for o in objects]
+        self.model_paths: List[str | None] = [o.model_path for o in objects]
+        self.material_styles: List[str] = [o.material_style for o in objects]
+        self.positions = _vec3_array([o.position for o in objects])
+        self.hpr = _vec3_array([o.hpr for o in objects])
+        self.scales = _vec3_array([o.scale for o in objects])
+        self._check_columns()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SceneRecipe):
+            return NotImplemented
+        return (
+            self.names == other.names
+            and self.model_paths == other.model_paths
+            and self.material_styles == other.material_styles
+            and np.array_equal(self.positions, other.positions)
+            and np.array_equal(self.hpr, other.hpr)
+            and np.array_equal(self.scales, other.scales)
+        )
 
-    def to_json(self) -> str:
-        return json.dumps({
-            "objects": [asdict(o) for o in self.objects]
-        }, indent=2)
+    def __getitem__(self, index: int) -> ObjectRecipe:
+        """Build a detached ObjectRecipe copy of one row."""
+        i = range(len(self))[index]
+        return ObjectRecipe(
+            name=self.names[i],
+            model_path=self.model_paths[i],
+            position=tuple(self.positions[i].tolist()),
+            hpr=tuple(self.hpr[i].tolist()),
+            scale=tuple(self.scales[i].tolist()),
+            material_style=self.material_styles[i],
+        )
+
+    def __repr__(self) -> str:
+        return f"SceneRecipe(objects={list(self.objects)!r})"
+
+    @property
+    def objects(self) -> tuple[ObjectRecipe, ...]:
+        """Detached ObjectRecipe copies of every row, rebuilt on each access.
+
+        Editing a returned ObjectRecipe doesn't change the scene; use append()
+        to add objects, and index the recipe (recipe[i]) to read a single row.
+        """
+        return tuple(self[i] for i in range(len(self)))
+
+    def append(self, obj: ObjectRecipe) -> None:
+        """Add one object to the end of every column."""
+        self.names.append(obj.name)
+        self.model_paths.append(obj.model_path)
+        self.material_styles.append(obj.material_style)
+        self.positions = np.vstack([self.positions, _vec3_array([obj.position])])
+        self.hpr = np.vstack([self.hpr, _vec3_array([obj.hpr])])
+        self.scales = np.vstack([self.scales, _vec3_array([obj.scale])])
+        self._check_columns()
+
+    def _dumps(self, compact: bool) -> bytes:
+        # Columns may have been replaced by bulk edits (slices, float32 math);
+        # normalize them so both backends see the same contiguous float64 data.
+        transforms = {
+            key: np.ascontiguousarray(getattr(self, key), dtype=np.float64)
+            for key in ("positions", "hpr", "scales")
+        }
+        columns: Dict[str, Any] = {
+            "names": self.names,
+            "model_paths": self.model_paths,
+            "material_styles": self.material_styles,
+        }
+        if HAVE_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps({**columns, **transforms}, option=option)
+        payload = {**columns, **{key: arr.tolist() for key, arr in transforms.items()}}
+        if compact:
+            return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def to_json(self, compact: bool = False) -> str:
+        return self._dumps(compact).decode("utf-8")
 
     @staticmethod
-    def from_json(data: str) -> "SceneRecipe":
-        obj = json.loads(data)
-        objects = [ObjectRecipe(
-            name=o.get("name", "object"),
-            model_path=o.get("model_path"),
-            position=tuple(o.get("position", [0, 0, 0])),
-            hpr=tuple(o.get("hpr", [0, 0, 0])),
-            scale=tuple(o.get("scale", [1, 1, 1])),
-            material_style=o.get("material_style", "checker"),
-        ) for o in obj.get("objects", [])]
-        return SceneRecipe(objects=objects)
-
-    def save(self, path: str) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.to_json())
+    def from_json(data: str | bytes) -> "SceneRecipe":
+        obj: Dict[str, Any] = orjson.loads(data) if HAVE_ORJSON else json.loads(data)
+        if "objects" in obj:
+            # Older recipes store one dict per object.
+            return SceneRecipe(objects=[ObjectRecipe(
+                name=o.get("name", "object"),
+                model_path=o.get("model_path"),
+                position=tuple(o.get("position", [0, 0, 0])),
+                hpr=tuple(o.get("hpr", [0, 0, 0])),
+                scale=tuple(o.get("scale", [1, 1, 1])),
+                material_style=o.get("material_style", "checker"),
+            ) for o in obj["objects"]])
+        recipe = SceneRecipe()
+        recipe.names = list(obj.get("names", []))
+        count = len(recipe.names)
+        recipe.model_paths = list(obj.get("model_paths", [None] * count))
+        recipe.material_styles = list(obj.get("material_styles", ["checker"] * count))
+        recipe.positions = _vec3_array(obj.get("positions", [[0, 0, 0]] * count))
+        recipe.hpr = _vec3_array(obj.get("hpr", [[0, 0, 0]] * count))
+        recipe.scales = _vec3_array(obj.get("scales", [[1, 1, 1]] * count))
+        recipe._check_columns()
+        return recipe
+
+    def _check_columns(self) -> None:
+        count = len(self.names)
+        for key in ("model_paths", "material_styles"):
+            if len(getattr(self, key)) != count:
+                raise ValueError(f"recipe has {count} names but {len(getattr(self, key))} {key}")
+        for key in ("positions", "hpr", "scales"):
+            shape = getattr(self, key).shape
+            if shape != (count, 3):
+                raise ValueError(f"recipe {key} has shape {shape}, expected ({count}, 3)")
+
+    def save(self, path: str, compact: bool = False) -> None:
+        with open(path, "wb") as f:
+            f.write(self._dumps(compact))
 
     @staticmethod
     def load(path: str) -> "SceneRecipe":
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "rb") as f:
             return SceneRecipe.from_json(f.read())
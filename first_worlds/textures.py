@@ -2,7 +2,7 @@
 
 Procedural texture generators for learning purposes.
 
-This module provides tiny, pure-Python utilities to generate simple
+This module provides tiny utilities to generate simple
 color, checkerboard and noise images that can be used as stand-ins for PBR
 maps (albedo/baseColor, roughness, metalness, normal-like height shading).
 
@@ -13,8 +13,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Tuple
 
-import math
-import random
+import importlib.util
+
+import numpy as np
 
 try:  # Optional Pillow dependency
     from PIL import Image, ImageFilter
@@ -44,10 +45,18 @@ except Exception:
         FIND_EDGES = object()
 
 
+# Optional Numba dependency for the noise kernel. Importing Numba and JIT
+# compiling are deferred to the first noise call, so plain imports stay fast.
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+
 Color = Tuple[int, int, int]
 
+# Lookup table for darkening edge maps (p -> 0.8 * p), applied by PIL in C.
+_EDGE_LUT = [min(255, int(p * 0.8)) for p in range(256)]
 
-@dataclass
+
+@dataclass(slots=True)
 class TextureMaps:
     """A small container for PBR-like texture maps.
 
@@ -72,119 +81,153 @@ def make_solid(size: int, color: Color):
 
 
 def make_checkerboard(size: int, squares: int, color_a: Color, color_b: Color):
-    """Generate a checkerboard image using pure Python loops.
+    """Generate a checkerboard image from a NumPy mask of alternating blocks.
     """
     if HAVE_PIL:
-        img = Image.new("RGB", (size, size), color_a)
-        px = img.load()
         block = max(1, size // squares)
-        for y in range(size):
-            for x in range(size):
-                if ((x // block) + (y // block)) % 2 == 0:
-                    px[x, y] = color_a
-                else:
-                    px[x, y] = color_b
-        return img
+        ys, xs = np.indices((size, size))
+        mask = (((xs // block) + (ys // block)) & 1).astype(bool)
+        arr = np.empty((size, size, 3), dtype=np.uint8)
+        arr[~mask] = color_a
+        arr[mask] = color_b
+        return Image.fromarray(arr, "RGB")
     # Fallback stub
     return Image.new("RGB", (size, size))
 
 
-def make_value_noise(size: int, octaves: int = 4, seed: int | None = None):
-    """Generate simple value noise as a grayscale image without numpy.
+def _accumulate_octave_numpy(out, grid, step: int, size: int, amplitude: float) -> None:
+    """Add one bilinearly interpolated octave of `grid` into `out`.
 
-    This is not Perlin/Simplex. It's intentionally simple: random grid values
-    bilinearly interpolated, combined over a few octaves.
+    Bilinear interpolation is separable: the coarse rows are blended along x
+    first (a small (step + 1, size) array), then along y straight into `out`.
     """
-    rng = random.Random(seed)
-
-    def lerp(a: float, b: float, t: float) -> float:
-        return a * (1.0 - t) + b * t
-
-    def noise_grid(step: int):
-        grid = [[rng.random() for _ in range(step + 1)] for _ in range(step + 1)]
-        out = [[0.0 for _ in range(size)] for _ in range(size)]
-        for yi in range(size):
-            y = yi * step / max(1, size - 1)
-            y0 = int(math.floor(y))
-            y1 = min(step, y0 + 1)
-            ty = y - y0
-            for xi in range(size):
-                x = xi * step / max(1, size - 1)
-                x0 = int(math.floor(x))
-                x1 = min(step, x0 + 1)
-                tx = x - x0
-                v00 = grid[y0][x0]
-                v10 = grid[y0][x1]
-                v01 = grid[y1][x0]
-                v11 = grid[y1][x1]
-                a = lerp(v00, v10, tx)
-                b = lerp(v01, v11, tx)
-                out[yi][xi] = lerp(a, b, ty)
-        return out
-
-    img = [[0.0 for _ in range(size)] for _ in range(size)]
+    y = np.linspace(0, step, size)
+    x = np.linspace(0, step, size)
+    y0 = np.floor(y).astype(int)
+    x0 = np.floor(x).astype(int)
+    y1 = np.minimum(step, y0 + 1)
+    x1 = np.minimum(step, x0 + 1)
+    ty = (y - y0).astype(np.float32)[:, None]
+    tx = (x - x0).astype(np.float32)
+    rows = grid[:, x0] * (1.0 - tx) + grid[:, x1] * tx
+    rows *= amplitude
+    lower = rows[y0]
+    lower *= 1.0 - ty
+    out += lower
+    upper = rows[y1]
+    upper *= ty
+    out += upper
+
+
+_numba_kernel = None
+
+
+def _accumulate_octave(out, grid, step: int, size: int, amplitude: float) -> None:
+    """Add one octave with the Numba kernel if it compiles, else with NumPy."""
+    global HAVE_NUMBA, _numba_kernel
+    if HAVE_NUMBA and _numba_kernel is None:
+        try:
+            from ._noise_numba import accumulate_octave
+            # Compile on a tiny input so a broken Numba install is caught here.
+            accumulate_octave(
+                np.zeros((2, 2), dtype=np.float32), np.zeros((2, 2), dtype=np.float32), 1, 2, 1.0
+            )
+            _numba_kernel = accumulate_octave
+        except Exception:
+            # The NumPy version computes the same result.
+            HAVE_NUMBA = False
+    if HAVE_NUMBA:
+        _numba_kernel(out, grid, step, size, amplitude)
+    else:
+        _accumulate_octave_numpy(out, grid, step, size, amplitude)
+
+
+def _value_noise_array(size: int, octaves: int = 4, seed: int | None = None) -> np.ndarray:
+    """Value noise normalized to 0..255 as a (size, size) uint8 array."""
+    rng = np.random.default_rng(seed)
+    steps = [max(1, size // (4 * 2 ** octave)) for octave in range(octaves)]
+    grids = [rng.random((step + 1, step + 1)).astype(np.float32) for step in steps]
+
+    # Every octave accumulates in place into this one buffer.
+    img = np.zeros((size, size), dtype=np.float32)
     amplitude = 1.0
-    frequency = 1
-    for _ in range(octaves):
-        step = max(1, size // (4 * frequency))
-        ng = noise_grid(step)
-        for y in range(size):
-            for x in range(size):
-                img[y][x] += amplitude * ng[y][x]
+    for step, grid in zip(steps, grids):
+        _accumulate_octave(img, grid, step, size, amplitude)
         amplitude *= 0.5
-        frequency *= 2
 
     # Normalize to 0..255
-    min_v = min(min(row) for row in img)
-    max_v = max(max(row) for row in img)
+    min_v = img.min()
+    max_v = img.max()
     scale = 255.0 / (max_v - min_v + 1e-6)
+    return ((img - min_v) * scale).astype(np.uint8)
+
 
+def make_value_noise(size: int, octaves: int = 4, seed: int | None = None):
+    """Generate simple value noise as a grayscale image using NumPy.
+
+    This is not Perlin/Simplex. It's intentionally simple: random grid values
+    bilinearly interpolated, combined over a few octaves. The interpolation
+    runs as a Numba kernel when Numba is installed.
+    """
     if HAVE_PIL:
-        out = Image.new("L", (size, size))
-        px = out.load()
-        for y in range(size):
-            for x in range(size):
-                px[x, y] = int((img[y][x] - min_v) * scale)
-        return out
+        return Image.fromarray(_value_noise_array(size, octaves, seed), "L")
     return Image.new("L", (size, size))
 
 
+def _checker_maps(size: int, seed: int | None) -> TextureMaps:
+    albedo = make_checkerboard(size, squares=8, color_a=(220, 220, 220), color_b=(40, 40, 40))
+    roughness = Image.new("L", (size, size), 160)
+    metalness = Image.new("L", (size, size), 0)
+    normal_like = Image.new("L", (size, size), 128)
+    return TextureMaps(albedo, roughness, metalness, normal_like)
+
+
+def _stone_maps(size: int, seed: int | None) -> TextureMaps:
+    base = make_value_noise(size, octaves=4, seed=seed)
+    if HAVE_PIL:
+        base_arr = np.asarray(base)
+        green = np.minimum(base_arr.astype(np.int16) + 15, 255).astype(np.uint8)
+        albedo = Image.fromarray(np.stack([base_arr, green, base_arr], axis=-1), "RGB")
+        roughness = base.filter(ImageFilter.GaussianBlur(radius=1.5))
+        metalness = Image.new("L", (size, size), 0)
+        normal_like = base.filter(ImageFilter.FIND_EDGES).point(_EDGE_LUT)
+    else:
+        albedo = Image.new("RGB", (size, size))
+        roughness = Image.new("L", (size, size))
+        metalness = Image.new("L", (size, size))
+        normal_like = Image.new("L", (size, size))
+    return TextureMaps(albedo, roughness, metalness, normal_like)
+
+
+def _metal_maps(size: int, seed: int | None) -> TextureMaps:
+    albedo = Image.new("RGB", (size, size), (128, 128, 128))
+    roughness = Image.new("L", (size, size), 50)
+    metalness = Image.new("L", (size, size), 200)
+    normal_like = Image.new("L", (size, size), 128)
+    return TextureMaps(albedo, roughness, metalness, normal_like)
+
+
+# The single list of known styles: add a builder here to add a style.
+_STYLE_BUILDERS = {
+    "checker": _checker_maps,
+    "stone": _stone_maps,
+    "metal": _metal_maps,
+}
+STYLES = tuple(_STYLE_BUILDERS)
+
+
+def resolve_style(style: str) -> str:
+    """Normalize a style name, mapping unknown names to "checker"."""
+    style = style.lower().strip()
+    return style if style in _STYLE_BUILDERS else "checker"
+
+
 def generate_pbr_like(size: int, style: str, seed: int | None = None) -> TextureMaps:
     """Generate a set of simple PBR-like maps by style keyword.
 
-    Supported styles:
+    Supported styles (unknown names fall back to "checker"):
     - "checker": high-contrast checkerboard albedo, mid roughness, zero metalness.
     - "stone": noisy albedo with blurred roughness and subtle height/normal-like details.
     - "metal": gray albedo, high metalness, low roughness.
     """
-    style = style.lower().strip()
-    if style == "checker":
-        albedo = make_checkerboard(size, squares=8, color_a=(220, 220, 220), color_b=(40, 40, 40))
-        roughness = Image.new("L", (size, size), 160)
-        metalness = Image.new("L", (size, size), 0)
-        normal_like = Image.new("L", (size, size), 128)
-        return TextureMaps(albedo, roughness, metalness, normal_like)
-
-    if style == "stone":
-        base = make_value_noise(size, octaves=4, seed=seed)
-        if HAVE_PIL:
-            albedo = Image.merge("RGB", (base, base.point(lambda p: min(255, p + 15)), base))  # type: ignore[attr-defined]
-            roughness = base.filter(ImageFilter.GaussianBlur(radius=1.5))
-            metalness = Image.new("L", (size, size), 0)
-            normal_like = base.filter(ImageFilter.FIND_EDGES).point(lambda p: min(255, int(p * 0.8)))
-        else:
-            albedo = Image.new("RGB", (size, size))
-            roughness = Image.new("L", (size, size))
-            metalness = Image.new("L", (size, size))
-            normal_like = Image.new("L", (size, size))
-        return TextureMaps(albedo, roughness, metalness, normal_like)
-
-    if style == "metal":
-        albedo = Image.new("RGB", (size, size), (128, 128, 128))
-        roughness = Image.new("L", (size, size), 50)
-        metalness = Image.new("L", (size, size), 200)
-        normal_like = Image.new("L", (size, size), 128)
-        return TextureMaps(albedo, roughness, metalness, normal_like)
-
-    # Fallback
-    return generate_pbr_like(size=size, style="checker", seed=seed)
+    return _STYLE_BUILDERS[resolve_style(style)](size, seed)
@@ -1,7 +1,14 @@
 import json
-from first_worlds.textures import generate_pbr_like
+import sys
+
+import numpy as np
+import pytest
+
+from first_worlds import recipe, textures
+from first_worlds.textures import STYLES, generate_pbr_like, resolve_style
 from first_worlds.commands import infer_style_from_prompt
 from first_worlds.recipe import SceneRecipe, ObjectRecipe
+from first_worlds.history import Action, History
 
 
 def test_generate_checker_maps():
@@ -12,13 +19,115 @@ def test_generate_checker_maps():
     assert maps.normal_like.size == (64, 64)
 
 
+def test_generate_stone_maps():
+    maps = generate_pbr_like(48, "stone", seed=1)
+    assert maps.albedo.size == (48, 48)
+    assert maps.roughness.size == (48, 48)
+    assert maps.normal_like.size == (48, 48)
+
+
+def test_accumulate_octave_bilinear_values():
+    # A linear grid, f(y, x) = 2y + x, is reproduced exactly by bilinear
+    # interpolation; sample points are 0, 0.5 and 1 along each axis.
+    grid = np.array([[0.0, 1.0], [2.0, 3.0]], dtype=np.float32)
+    out = np.ones((3, 3), dtype=np.float32)
+    textures._accumulate_octave_numpy(out, grid, 1, 3, 0.5)
+    expected = 1.0 + 0.5 * np.array([
+        [0.0, 0.5, 1.0],
+        [1.0, 1.5, 2.0],
+        [2.0, 2.5, 3.0],
+    ])
+    np.testing.assert_allclose(out, expected, atol=1e-6)
+
+
+def test_accumulate_octave_hits_grid_points_and_cell_centres():
+    grid = np.random.default_rng(0).random((3, 3)).astype(np.float32)
+    out = np.zeros((5, 5), dtype=np.float32)
+    textures._accumulate_octave_numpy(out, grid, 2, 5, 1.0)
+    np.testing.assert_allclose(out[::2, ::2], grid, atol=1e-6)
+    assert out[1, 1] == pytest.approx(grid[:2, :2].mean(), abs=1e-6)
+    assert out[3, 2] == pytest.approx((grid[1, 1] + grid[2, 1]) / 2, abs=1e-6)
+
+
+def test_value_noise_is_deterministic_per_seed():
+    a = textures._value_noise_array(48, seed=7)
+    assert a.dtype == np.uint8 and a.shape == (48, 48)
+    assert a.min() == 0 and a.max() >= 254
+    np.testing.assert_array_equal(a, textures._value_noise_array(48, seed=7))
+    assert not np.array_equal(a, textures._value_noise_array(48, seed=8))
+
+
+@pytest.mark.parametrize("size, step", [(1, 1), (2, 1), (17, 4), (64, 3), (64, 16)])
+def test_numba_octave_matches_numpy(size, step):
+    pytest.importorskip("numba")
+    from first_worlds._noise_numba import accumulate_octave
+    grid = np.random.default_rng(size + step).random((step + 1, step + 1)).astype(np.float32)
+    expected = np.zeros((size, size), dtype=np.float32)
+    actual = np.zeros((size, size), dtype=np.float32)
+    textures._accumulate_octave_numpy(expected, grid, step, size, 0.5)
+    accumulate_octave(actual, grid, step, size, 0.5)
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+def test_accumulate_octave_falls_back_when_numba_fails(monkeypatch):
+    # Pretend Numba is installed but its kernel module can't be loaded.
+    monkeypatch.setattr(textures, "HAVE_NUMBA", True)
+    monkeypatch.setattr(textures, "_numba_kernel", None)
+    monkeypatch.setitem(sys.modules, "first_worlds._noise_numba", None)
+    grid = np.random.default_rng(0).random((5, 5)).astype(np.float32)
+    actual = np.zeros((16, 16), dtype=np.float32)
+    expected = np.zeros((16, 16), dtype=np.float32)
+    textures._accumulate_octave(actual, grid, 4, 16, 1.0)
+    textures._accumulate_octave_numpy(expected, grid, 4, 16, 1.0)
+    assert textures.HAVE_NUMBA is False
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_resolve_style():
+    assert resolve_style(" Stone ") == "stone"
+    assert resolve_style("metal") == "metal"
+    assert resolve_style("stoen") == "checker"
+    assert resolve_style("") == "checker"
+    assert set(STYLES) == {"checker", "stone", "metal"}
+
+
+def test_new_style_builder_is_recognised(monkeypatch):
+    maps = generate_pbr_like(8, "metal")
+    monkeypatch.setitem(textures._STYLE_BUILDERS, "wood", lambda size, seed: maps)
+    assert resolve_style(" Wood") == "wood"
+    assert generate_pbr_like(8, "wood") is maps
+
+
 def test_infer_style_from_prompt():
     assert infer_style_from_prompt("make floor wet cobblestone at night") == "stone"
     assert infer_style_from_prompt("super shiny chrome look") == "metal"
     assert infer_style_from_prompt("unknown words") == "checker"
 
 
-def test_scene_recipe_roundtrip(tmp_path):
+def test_infer_style_keyword_matching():
+    # The first keyword in the text wins, regardless of style order.
+    assert infer_style_from_prompt("metal grid floor") == "metal"
+    assert infer_style_from_prompt("grid of metal") == "checker"
+    # Keywords match at a word start, so plurals count but mid-word hits don't.
+    assert infer_style_from_prompt("a pile of rocks") == "stone"
+    assert infer_style_from_prompt("bedrock") == "checker"
+    # The wet-stone fallback still catches stone words the pattern skips.
+    assert infer_style_from_prompt("wet flagstone") == "stone"
+    assert infer_style_from_prompt("Flagstone path") == "checker"
+    assert infer_style_from_prompt("POLISHED STEEL") == "metal"
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run recipe tests against both the orjson and the stdlib backend."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(recipe, "HAVE_ORJSON", False)
+    return request.param
+
+
+def test_scene_recipe_roundtrip(tmp_path, json_backend):
     scene = SceneRecipe(objects=[
         ObjectRecipe(
             name="cube",
@@ -32,6 +141,178 @@ def test_scene_recipe_roundtrip(tmp_path):
     path = tmp_path / "scene.json"
     scene.save(str(path))
     loaded = SceneRecipe.load(str(path))
-    assert loaded.objects[0].name == "cube"
-    assert loaded.objects[0].position == (1.0, 2.0, 3.0)
-    assert loaded.objects[0].material_style == "stone"
+    assert loaded[0].name == "cube"
+    assert loaded[0].position == (1.0, 2.0, 3.0)
+    assert loaded[0].material_style == "stone"
+
+
+def test_scene_recipe_roundtrip_keeps_exact_floats(tmp_path, json_backend):
+    obj = ObjectRecipe("cube", None, (0.1, 0.2, 1.3), (12.5, 0.3, 0.0), (0.7, 1.0, 2.2), "stone")
+    scene = SceneRecipe(objects=[obj])
+    assert scene[0] == obj
+    path = tmp_path / "scene.json"
+    scene.save(str(path))
+    assert "0.1," in path.read_text()
+    assert SceneRecipe.load(str(path))[0] == obj
+
+
+def test_scene_recipe_append_and_read_only_objects(json_backend):
+    scene = SceneRecipe()
+    obj = ObjectRecipe("cube", None, (1.0, 2.0, 3.0), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0), "metal")
+    scene.append(obj)
+    scene.append(ObjectRecipe("ball", "ball.glb", (0.5, 0.0, 0.0), (0.0, 0.0, 0.0), (2.0, 2.0, 2.0), "stone"))
+    assert len(scene) == 2
+    assert scene.positions.shape == (2, 3)
+    assert scene[0] == obj
+    assert isinstance(scene.objects, tuple)
+    assert scene[1].name == "ball"
+    assert scene[-1] == scene.objects[1]
+    with pytest.raises(IndexError):
+        scene[2]
+    assert repr(scene).startswith("SceneRecipe(objects=[ObjectRecipe(name='cube'")
+    assert SceneRecipe.from_json(scene.to_json()) == scene
+
+
+def test_scene_recipe_loads_per_object_json(json_backend):
+    data = json.dumps({"objects": [
+        {"name": "a", "position": [1, 2, 3], "material_style": "metal"},
+        {"name": "b", "scale": [2, 2, 2]},
+    ]})
+    scene = SceneRecipe.from_json(data)
+    assert len(scene) == 2
+    assert scene.positions.shape == (2, 3)
+    assert scene[0].position == (1.0, 2.0, 3.0)
+    assert scene[1].scale == (2.0, 2.0, 2.0)
+    assert scene[1].material_style == "checker"
+
+
+@pytest.mark.parametrize("payload", [
+    {"names": ["a", "b"], "positions": [[1, 2, 3]]},
+    {"names": ["a"], "positions": [[1, 2, 3, 4, 5, 6]]},
+    {"names": ["a"], "hpr": [1, 2, 3]},
+    {"names": ["a"], "material_styles": ["stone", "metal"]},
+])
+def test_scene_recipe_rejects_mismatched_columns(payload, json_backend):
+    with pytest.raises(ValueError):
+        SceneRecipe.from_json(json.dumps(payload))
+
+
+def test_scene_recipe_compact_json(json_backend):
+    scene = SceneRecipe(objects=[
+        ObjectRecipe("cube", None, (1.0, 2.0, 3.0), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0), "metal"),
+    ])
+    text = scene.to_json(compact=True)
+    assert "\n" not in text
+    loaded = SceneRecipe.from_json(text)
+    assert loaded[0] == scene[0]
+
+
+def test_history_drops_oldest_actions():
+    values = []
+    history = History(max_history=2)
+    for i in range(3):
+        history.apply(Action(do=lambda i=i: values.append(i), undo=values.pop))
+    assert history.undo()
+    assert history.undo()
+    assert not history.undo()
+    assert values == [0]
+    assert history.redo()
+    assert values == [0, 1]
+
+
+def test_scene_recipe_backends_write_same_values(monkeypatch):
+    pytest.importorskip("orjson")
+    scene = SceneRecipe(objects=[
+        ObjectRecipe("pierre", None, (0.1, -2.5, 1e-7), (0.0, 90.0, 0.3), (1.0, 1.0, 1.0), "stone"),
+        ObjectRecipe("galet", None, (4.0, 5.5, 6.0), (1.0, 2.0, 3.0), (0.5, 0.5, 0.5), "stone"),
+    ])
+    # Bulk edits may leave a column non-contiguous or float32.
+    scene.positions = scene.positions[:, ::-1]
+    scene.scales = scene.scales.astype(np.float32) * np.float32(0.1)
+    assert not scene.positions.flags["C_CONTIGUOUS"]
+    for compact in (False, True):
+        fast = scene.to_json(compact=compact)
+        monkeypatch.setattr(recipe, "HAVE_ORJSON", False)
+        slow = scene.to_json(compact=compact)
+        monkeypatch.setattr(recipe, "HAVE_ORJSON", True)
+        assert json.loads(fast) == json.loads(slow)
+    assert SceneRecipe.from_json(fast)[0].position == (1e-7, -2.5, 0.1)
+
+
+@pytest.mark.parametrize("mode, components", [("RGB", 3), ("RGBA", 4), ("L", 4)])
+def test_pil_to_panda_texture_pixels_and_mipmaps(mode, components):
+    pytest.importorskip("panda3d")
+    Image = pytest.importorskip("PIL.Image")
+    from panda3d.core import PNMImage
+    from first_worlds.materials import pil_to_panda_texture
+
+    width, height = 5, 3
+    corners = {
+        (0, 0): (255, 0, 0, 200),
+        (width - 1, 0): (0, 255, 0, 150),
+        (0, height - 1): (0, 0, 255, 100),
+        (width - 1, height - 1): (10, 20, 30, 50),
+    }
+    img = Image.new("RGBA", (width, height), (128, 128, 128, 255))
+    for xy, color in corners.items():
+        img.putpixel(xy, color)
+    img = img.convert(mode)
+    expected = img.convert("RGBA")
+
+    tex = pil_to_panda_texture(img)
+    assert (tex.get_x_size(), tex.get_y_size()) == (width, height)
+    assert tex.get_num_components() == components
+    levels = tex.get_expected_num_mipmap_levels()
+    assert tex.get_num_ram_mipmap_images() == levels
+    assert all(tex.has_ram_mipmap_image(n) for n in range(levels))
+
+    # PNMImage rows are top-down like Pillow's, so pixels should line up 1:1.
+    pnm = PNMImage()
+    assert tex.store(pnm)
+    for xy in corners:
+        r, g, b, a = expected.getpixel(xy)
+        assert (pnm.get_red_val(*xy), pnm.get_green_val(*xy), pnm.get_blue_val(*xy)) == (r, g, b)
+        if components == 4:
+            assert pnm.get_alpha_val(*xy) == a
+
+
+class _StubNodePath:
+    def __init__(self):
+        self.tags = {}
+        self.inputs = []
+
+    def get_python_tag(self, key):
+        return self.tags.get(key)
+
+    def set_python_tag(self, key, value):
+        self.tags[key] = value
+
+    def set_shader_input(self, name, value):
+        self.inputs.append((name, value))
+
+
+def test_apply_material_skips_repeated_textures():
+    pytest.importorskip("panda3d")
+    from first_worlds.materials import MaterialParams, apply_material
+
+    base, mr = object(), object()
+    node = _StubNodePath()
+    apply_material(node, MaterialParams(base, mr))
+    assert len(node.inputs) == 2
+
+    node.inputs.clear()
+    apply_material(node, MaterialParams(base, mr))
+    assert node.inputs == []
+
+    other = object()
+    apply_material(node, MaterialParams(other, mr))
+    assert node.inputs == [
+        ("p3d_TextureBaseColor", other),
+        ("p3d_TextureMetalRoughness", mr),
+    ]
+
+    # Only the metal-roughness slot changes (to None); that must not be skipped.
+    node.inputs.clear()
+    apply_material(node, MaterialParams(other, None))
+    assert node.inputs == [("p3d_TextureBaseColor", other)]
+    assert node.tags["_fw_mat"] == (other, None)